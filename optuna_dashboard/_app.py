@@ -212,7 +212,7 @@ def create_app(
         is_preferential = system_attrs.get(_SYSTEM_ATTR_PREFERENTIAL_STUDY, False)
         # TODO(c-bata): Cache best_trials
         if is_preferential:
-            best_trials = get_best_preferential_trials(study_id, storage)
+            best_trials = get_best_preferential_trials(study_id, storage, deepcopy=False)
         elif len(study.directions) == 1:
             if len([t for t in trials if t.state == TrialState.COMPLETE]) == 0:
                 best_trials = []
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import copy
+import itertools
 from typing import Any
 from typing import Container
 from typing import Iterable
@@ -10,12 +11,14 @@ from optuna import logging
 from optuna._imports import try_import
 from optuna.distributions import BaseDistribution
 from optuna.samplers import BaseSampler
+from optuna.trial import BaseTrial
 from optuna.trial import FrozenTrial
 from optuna.trial import TrialState
 from optuna_dashboard.preferential._system_attrs import get_n_generate
 from optuna_dashboard.preferential._system_attrs import get_preferences
 from optuna_dashboard.preferential._system_attrs import get_skipped_trial_ids
 from optuna_dashboard.preferential._system_attrs import is_skipped_trial
+from optuna_dashboard.preferential._system_attrs import iter_preferences
 from optuna_dashboard.preferential._system_attrs import report_preferences
 from optuna_dashboard.preferential._system_attrs import set_n_generate
 
@@ -47,6 +50,8 @@ class PreferentialStudy:
         The interface may change in newer versions without prior notice.
     """
 
+    __slots__ = ("_study",)
+
     def __init__(self, study: optuna.Study) -> None:
         self._study = study
 
@@ -73,7 +78,7 @@ class PreferentialStudy:
         Returns:
             A list of FrozenTrial object
         """
-        return get_best_trials(self._study._study_id, self._study._storage)
+        return get_best_trials(self._study._study_id, self._study._storage, deepcopy=True)
 
     @property
     def study_name(self) -> str:
@@ -104,10 +109,16 @@ class PreferentialStudy:
     def preferences(self) -> list[tuple[FrozenTrial, FrozenTrial]]:
         """Return results of pairwise comparison.
 
+        The returned trials are not copied, so you shouldn't mutate any fields of them.
+        Otherwise the internal state of the study may corrupt and unexpected behavior may
+        happen. Please use
+        :meth:`~optuna_dashboard.preferential.PreferentialStudy.get_preferences` with
+        ``deepcopy=True`` if you need to modify them.
+
         Returns:
             A list of the pair of FrozenTrial objects. The left trial is better than the right one.
         """
-        return self.get_preferences(deepcopy=True)
+        return self.get_preferences(deepcopy=False)
 
     def get_trials(
         self,
@@ -217,8 +228,8 @@ class PreferentialStudy:
 
     def report_preference(
         self,
-        better_trials: FrozenTrial | list[FrozenTrial],
-        worse_trials: FrozenTrial | list[FrozenTrial],
+        better_trials: FrozenTrial | Iterable[FrozenTrial],
+        worse_trials: FrozenTrial | Iterable[FrozenTrial],
     ) -> None:
         """Report results of pairwise comparison.
 
@@ -228,15 +239,18 @@ class PreferentialStudy:
             worse_trials:
                 Trials that are worse than better_trials.
         """
-        if not isinstance(better_trials, list):
+        # ``optuna.Trial`` objects returned by ``ask()`` are also accepted as a single trial.
+        if isinstance(better_trials, BaseTrial):
             better_trials = [better_trials]
-        if not isinstance(worse_trials, list):
+        if isinstance(worse_trials, BaseTrial):
             worse_trials = [worse_trials]
 
+        better_numbers = [b.number for b in better_trials]
+        worse_numbers = [w.number for w in worse_trials]
         report_preferences(
             self._study._study_id,
             self._study._storage,
-            [(b.number, w.number) for b in better_trials for w in worse_trials],
+            list(itertools.product(better_numbers, worse_numbers)),
         )
 
     def get_preferences(self, *, deepcopy: bool = True) -> list[tuple[FrozenTrial, FrozenTrial]]:
@@ -252,11 +266,16 @@ class PreferentialStudy:
         Returns:
             A list of the pair of FrozenTrial objects. The left trial is better than the right one.
         """
-
         preferences = get_preferences(
             self._study._storage.get_study_system_attrs(self._study._study_id)
         )  # Must come before study.get_trials()
-        trials = self._study.get_trials(deepcopy=deepcopy)
+        all_trials = self._study.get_trials(deepcopy=False)
+        if not deepcopy:
+            return [(all_trials[better], all_trials[worse]) for (better, worse) in preferences]
+
+        # Only deepcopy the trials referenced by preferences instead of all trials in the study.
+        numbers = {n for pair in preferences for n in pair}
+        trials = {n: copy.deepcopy(all_trials[n]) for n in numbers}
         return [(trials[better], trials[worse]) for (better, worse) in preferences]
 
     def set_user_attr(self, key: str, value: Any) -> None:
@@ -287,30 +306,37 @@ class PreferentialStudy:
         trials = self._study.get_trials(
             deepcopy=False, states=(TrialState.COMPLETE, TrialState.RUNNING)
         )
-        worse_trial_numbers = {worse for _, worse in get_preferences(study_system_attrs)}
-        skipped_trial_ids = set(get_skipped_trial_ids(study_system_attrs))
+        worse_trial_numbers = frozenset(worse for _, worse in iter_preferences(study_system_attrs))
+        skipped_trial_ids = frozenset(get_skipped_trial_ids(study_system_attrs))
         active_trials = [
             t
             for t in trials
             if t.number not in worse_trial_numbers and t._trial_id not in skipped_trial_ids
         ]
-        return len(active_trials) < get_n_generate(self._study.system_attrs)
-
+        return len(active_trials) < get_n_generate(study_system_attrs)
 
-def get_best_trials(study_id: int, storage: optuna.storages.BaseStorage) -> list[FrozenTrial]:
-    preferences = get_preferences(storage.get_study_system_attrs(study_id))
-    worse_numbers = {worse for _, worse in preferences}
-    nondominated_numbers = {better for better, _ in preferences if better not in worse_numbers}
-    trials = storage.get_all_trials(study_id, deepcopy=False)
 
+def get_best_trials(
+    study_id: int, storage: optuna.storages.BaseStorage, *, deepcopy: bool = True
+) -> list[FrozenTrial]:
     study_system_attrs = storage.get_study_system_attrs(study_id)
-
+    worse_numbers = frozenset(worse for _, worse in iter_preferences(study_system_attrs))
+    nondominated_numbers = {
+        better for better, _ in iter_preferences(study_system_attrs) if better not in worse_numbers
+    }
+    if not nondominated_numbers:
+        # No preferences are reported yet, so there is no need to load trials.
+        return []
+
+    # Only load the nondominated trials instead of all trials in the study.
     best_trials = []
     for n in nondominated_numbers:
-        t = trials[n]
-        if is_skipped_trial(t._trial_id, study_system_attrs):
+        trial_id = storage.get_trial_id_from_study_id_trial_number(study_id, n)
+        if is_skipped_trial(trial_id, study_system_attrs):
             continue
-        best_trials.append(copy.deepcopy(t))
+        best_trials.append(storage.get_trial(trial_id))
+    if deepcopy:
+        return [copy.deepcopy(t) for t in best_trials]
     return best_trials
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Any
+from typing import Iterator
 import uuid
 
 from optuna.storages import BaseStorage
@@ -24,24 +25,25 @@ def report_preferences(
         key=key,
         value=preferences,
     )
-    trials = storage.get_all_trials(study_id, deepcopy=False)
     directions = storage.get_study_directions(study_id)
     values = [0 for _ in directions]
     updated_trials = {num for tpl in preferences for num in tpl}
     for number in updated_trials:
-        trial_id = trials[number]._trial_id
-        if trials[number].state != TrialState.COMPLETE:
+        trial_id = storage.get_trial_id_from_study_id_trial_number(study_id, number)
+        if storage.get_trial(trial_id).state != TrialState.COMPLETE:
             storage.set_trial_state_values(trial_id, TrialState.COMPLETE, values)
     return preference_id
 
 
-def get_preferences(study_system_attrs: dict[str, Any]) -> list[tuple[int, int]]:
-    preferences: list[tuple[int, int]] = []
+def iter_preferences(study_system_attrs: dict[str, Any]) -> Iterator[tuple[int, int]]:
     for k, v in study_system_attrs.items():
         if not k.startswith(_SYSTEM_ATTR_PREFIX_PREFERENCE):
             continue
-        preferences.extend(v)  # type: ignore
-    return preferences
+        yield from v
+
+
+def get_preferences(study_system_attrs: dict[str, Any]) -> list[tuple[int, int]]:
+    return list(iter_preferences(study_system_attrs))
 
 
 def is_preference_removed(study_system_attrs: dict[str, Any], preference_id: str) -> bool:
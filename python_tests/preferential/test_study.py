@@ -16,8 +16,15 @@ from optuna import distributions
 from optuna import Trial
 from optuna.exceptions import DuplicatedStudyError
 from optuna.trial import TrialState
+from optuna_dashboard._preferential_history import NewHistory
+from optuna_dashboard._preferential_history import remove_history
+from optuna_dashboard._preferential_history import report_history
+from optuna_dashboard._preferential_history import restore_history
 from optuna_dashboard.preferential import create_study
 from optuna_dashboard.preferential import load_study
+from optuna_dashboard.preferential import PreferentialStudy
+from optuna_dashboard.preferential._study import get_best_trials
+from optuna_dashboard.preferential._system_attrs import report_skip
 from packaging import version
 import pytest
 
@@ -59,6 +66,82 @@ def test_report_and_get_preferences(storage_supplier: Callable[[], StorageSuppli
         assert actual_worse.number == worse.number
 
 
+def test_report_preference_with_asked_trials() -> None:
+    study = create_study(n_generate=4)
+    study.report_preference(study.ask(), study.ask())
+    assert [(b.number, w.number) for b, w in study.preferences] == [(0, 1)]
+
+    study.report_preference([study.ask()], (study.ask(),))
+    assert sorted((b.number, w.number) for b, w in study.preferences) == [(0, 1), (2, 3)]
+
+
+def test_report_preference_with_multiple_trials() -> None:
+    study = create_study(n_generate=4)
+    for _ in range(4):
+        study.ask()
+    trials = study.trials
+
+    study.report_preference((trials[0], trials[1]), (t for t in trials[2:]))
+    actual = sorted((b.number, w.number) for b, w in study.preferences)
+    assert actual == [(0, 2), (0, 3), (1, 2), (1, 3)]
+
+
+@parametrize_storages
+def test_get_preferences_reflects_updates(storage_supplier: Callable[[], StorageSupplier]) -> None:
+    with storage_supplier() as storage:
+        study = create_study(n_generate=4, storage=storage)
+        for _ in range(3):
+            study.ask()
+        study.report_preference(study.trials[0], study.trials[1])
+        assert len(study.preferences) == 1
+
+        # Preferences reported via another study object must be visible.
+        another_study = PreferentialStudy(study._study)
+        another_study.report_preference(study.trials[1], study.trials[2])
+        assert sorted((b.number, w.number) for b, w in study.preferences) == [(0, 1), (1, 2)]
+
+        # Preferences removed and restored via the dashboard must be visible.
+        study_id = study._study._study_id
+        history_id = report_history(
+            study_id=study_id,
+            storage=study._study._storage,
+            input_data=NewHistory(mode="ChooseWorst", candidates=[0, 2], clicked=0),
+        )
+        assert len(study.preferences) == 3
+        remove_history(study_id, study._study._storage, history_id)
+        assert len(study.preferences) == 2
+        restore_history(study_id, study._study._storage, history_id)
+        assert sorted((b.number, w.number) for b, w in study.preferences) == [
+            (0, 1),
+            (1, 2),
+            (2, 0),
+        ]
+
+
+@parametrize_storages
+def test_get_preferences_deepcopy_option(storage_supplier: Callable[[], StorageSupplier]) -> None:
+    with storage_supplier() as storage:
+        study = create_study(n_generate=4, storage=storage)
+        for _ in range(3):
+            study.ask()
+        study.report_preference(study.trials[0], study.trials[1])
+
+        with patch("copy.deepcopy", wraps=copy.deepcopy) as mock_object:
+            preferences0 = study.get_preferences(deepcopy=False)
+            assert mock_object.call_count == 0
+            assert [(b.number, w.number) for b, w in preferences0] == [(0, 1)]
+
+            preferences1 = study.get_preferences(deepcopy=True)
+            assert mock_object.call_count > 0
+            assert preferences0 == preferences1
+
+            # `study.preferences` is equivalent to `study.get_preferences(deepcopy=False)`.
+            old_count = mock_object.call_count
+            preferences2 = study.preferences
+            assert mock_object.call_count == old_count
+            assert preferences0 == preferences2
+
+
 def test_study_pickle() -> None:
     study_1 = create_study(
         n_generate=4,
@@ -268,6 +351,72 @@ def test_get_trials(storage_supplier: Callable[[], StorageSupplier]) -> None:
             assert trials0 == trials2
 
 
+@parametrize_storages
+def test_get_best_trials(storage_supplier: Callable[[], StorageSupplier]) -> None:
+    with storage_supplier() as storage:
+        study = create_study(n_generate=4, storage=storage)
+        for _ in range(3):
+            study.ask()
+        study.report_preference(study.trials[0], study.trials[1])
+
+        with patch("copy.deepcopy", wraps=copy.deepcopy) as mock_object:
+            best_trials0 = get_best_trials(
+                study._study._study_id, study._study._storage, deepcopy=False
+            )
+            assert mock_object.call_count == 0
+            assert [t.number for t in best_trials0] == [0]
+
+            best_trials1 = get_best_trials(
+                study._study._study_id, study._study._storage, deepcopy=True
+            )
+            assert mock_object.call_count > 0
+            assert best_trials0 == best_trials1
+
+            # `study.best_trials` is equivalent to `get_best_trials(..., deepcopy=True)`.
+            old_count = mock_object.call_count
+            best_trials2 = study.best_trials
+            assert mock_object.call_count > old_count
+            assert best_trials0 == best_trials2
+
+
+@parametrize_storages
+def test_get_best_trials_without_preferences(
+    storage_supplier: Callable[[], StorageSupplier]
+) -> None:
+    with storage_supplier() as storage:
+        study = create_study(n_generate=4, storage=storage)
+        for _ in range(3):
+            study.ask()
+
+        storage_ = study._study._storage
+        with patch.object(
+            storage_, "get_trial", wraps=storage_.get_trial
+        ) as get_trial_mock, patch.object(
+            storage_,
+            "get_trial_id_from_study_id_trial_number",
+            wraps=storage_.get_trial_id_from_study_id_trial_number,
+        ) as get_trial_id_mock:
+            assert study.best_trials == []
+            assert get_trial_mock.call_count == 0
+            assert get_trial_id_mock.call_count == 0
+
+
+@parametrize_storages
+def test_get_best_trials_excludes_skipped_trials(
+    storage_supplier: Callable[[], StorageSupplier]
+) -> None:
+    with storage_supplier() as storage:
+        study = create_study(n_generate=4, storage=storage)
+        for _ in range(4):
+            study.ask()
+        study.report_preference(study.trials[0], study.trials[1])
+        study.report_preference(study.trials[2], study.trials[3])
+        assert sorted(t.number for t in study.best_trials) == [0, 2]
+
+        report_skip(study._study._study_id, study.trials[2]._trial_id, study._study._storage)
+        assert [t.number for t in study.best_trials] == [0]
+
+
 @parametrize_storages
 def test_get_trials_state_option(storage_supplier: Callable[[], StorageSupplier]) -> None:
     with storage_supplier() as storage:
@@ -299,6 +448,28 @@ def test_get_trials_state_option(storage_supplier: Callable[[], StorageSupplier]
             assert len(trials) == 0
 
 
+@parametrize_storages
+def test_should_generate(storage_supplier: Callable[[], StorageSupplier]) -> None:
+    with storage_supplier() as storage:
+        study = create_study(n_generate=2, storage=storage)
+        assert study.should_generate()
+
+        study.ask()
+        study.ask()
+        assert not study.should_generate()
+
+        # Trials reported as worse are no longer active.
+        study.report_preference(study.trials[0], study.trials[1])
+        assert study.should_generate()
+
+        study.ask()
+        assert not study.should_generate()
+
+        # Skipped trials are no longer active.
+        report_skip(study._study._study_id, study.trials[2]._trial_id, study._study._storage)
+        assert study.should_generate()
+
+
 def test_ask() -> None:
     study = create_study(
         n_generate=4,